@@ -1,5 +1,7 @@
 # backend/app/routers/chat.py
+import json
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from ..models.employee import ChatRequest, ChatResponse, EmployeeSearchResult
 from ..services.rag_service import RAGService
 
@@ -16,3 +18,18 @@ def chat(req: ChatRequest):
             EmployeeSearchResult(employee=c["employee"], score=c["score"])
         )
     return {"answer": result["answer"], "candidates": candidates}
+
+@router.post("/stream")
+def chat_stream(req: ChatRequest):
+    """Stream NDJSON events: one per candidate as soon as retrieval is done, then answer chunks."""
+    rag = RAGService.instance()
+
+    def events():
+        for event in rag.generate_stream(req.query, top_k=req.top_k):
+            if event["type"] == "candidate":
+                # validate through the same model as /chat/ so both endpoints emit identical candidates
+                result = EmployeeSearchResult(employee=event["employee"], score=event["score"])
+                event = {"type": "candidate", **result.model_dump()}
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
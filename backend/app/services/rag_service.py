@@ -1,5 +1,5 @@
 # backend/app/services/rag_service.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from .embedding_service import EmbeddingService
 from .data_service import DataService
 from ..utils.response_formatter import format_candidates_text, template_generate_response
@@ -122,15 +122,9 @@ class RAGService:
         return [{"employee": self.embedding_service.meta[i], "score": s} for i, s in idxs_scores]
 
 
-    def generate(self, query: str, top_k: int = None) -> Dict[str, Any]:
-        top_k = top_k or self.top_k
-
-        # 1️⃣ Retrieve candidates using dynamic filter + embeddings
-        candidates = self.retrieve(query, top_k=top_k)
-
-        # 2️⃣ Format candidates for response
+    def _build_prompt(self, query: str, candidates: List[Dict[str, Any]]) -> str:
         candidates_text = format_candidates_text([c["employee"] for c in candidates])
-        prompt = f"""
+        return f"""
     You are a helpful HR assistant. User query: "{query}"
 
     Top candidates:
@@ -139,6 +133,15 @@ class RAGService:
     Write a professional response recommending these candidates. Mention years of experience, relevant projects and skills, and availability. End with a follow-up question asking if the user wants more details or to schedule meetings.
     """
 
+    def generate(self, query: str, top_k: int = None) -> Dict[str, Any]:
+        top_k = top_k or self.top_k
+
+        # 1️⃣ Retrieve candidates using dynamic filter + embeddings
+        candidates = self.retrieve(query, top_k=top_k)
+
+        # 2️⃣ Format candidates for response
+        prompt = self._build_prompt(query, candidates)
+
         # 3️⃣ Attempt Ollama (Mistral) generation
         # In rag_service.py, improve error handling:
         if OLLAMA_AVAILABLE and SETTINGS.USE_OLLAMA:
@@ -158,4 +161,32 @@ class RAGService:
         answer = template_generate_response(query, [c["employee"] for c in candidates])
         return {"answer": answer, "candidates": candidates}
 
-        
\ No newline at end of file
+    def generate_stream(self, query: str, top_k: int = None) -> Iterator[Dict[str, Any]]:
+        """Like generate(), but yields events: each candidate first, then answer chunks."""
+        top_k = top_k or self.top_k
+
+        candidates = self.retrieve(query, top_k=top_k)
+        for c in candidates:
+            yield {"type": "candidate", "employee": c["employee"], "score": c["score"]}
+
+        if OLLAMA_AVAILABLE and SETTINGS.USE_OLLAMA:
+            streamed = False
+            try:
+                stream = ollama.chat(
+                    model=SETTINGS.OLLAMA_MODEL,
+                    messages=[{"role": "user", "content": self._build_prompt(query, candidates)}],
+                    options={'timeout': 30},
+                    stream=True
+                )
+                for part in stream:
+                    chunk = part.get("message", {}).get("content", "")
+                    if chunk:
+                        streamed = True
+                        yield {"type": "answer", "content": chunk}
+            except Exception as exc:
+                print(f"Ollama stream failed: {exc}, falling back to template")
+            # Only fall back if nothing reached the client, so answers are never mixed
+            if streamed:
+                return
+        answer = template_generate_response(query, [c["employee"] for c in candidates])
+        yield {"type": "answer", "content": answer}
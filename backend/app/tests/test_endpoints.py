@@ -10,3 +10,25 @@ def test_root():
     r = client.get("/")
     assert r.status_code == 200
     assert "HR Resource Query Chatbot" in r.json().get("message","") or "API" in r.json().get("message","")
+
+
+def test_chat_stream_sends_candidates_before_answer(monkeypatch):
+    import json
+    from ..services.rag_service import RAGService
+
+    employee = {"id": 1, "name": "Alice", "role": "Engineer", "skills": ["Python"],
+                "experience_years": 4, "projects": ["Portal"], "availability": "available"}
+
+    class StubRAG:
+        def generate_stream(self, query, top_k=None):
+            yield {"type": "candidate", "employee": employee, "score": 0.9}
+            yield {"type": "answer", "content": "Alice "}
+            yield {"type": "answer", "content": "fits."}
+
+    monkeypatch.setattr(RAGService, "_instance", StubRAG())
+    r = client.post("/chat/stream", json={"query": "python", "top_k": 1})
+    assert r.status_code == 200
+    events = [json.loads(line) for line in r.text.splitlines() if line]
+    assert [e["type"] for e in events] == ["candidate", "answer", "answer"]
+    assert events[0]["employee"]["name"] == "Alice"
+    assert "".join(e["content"] for e in events[1:]) == "Alice fits."
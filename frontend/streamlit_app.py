@@ -32,10 +32,14 @@
 # frontend/streamlit_app.py
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+import json
 import time
 
 # Configuration
 API_URL = "http://127.0.0.1:8000"
+REQUEST_TIMEOUT = 30
+CACHE_TTL_SECONDS = 300
 st.set_page_config(page_title="HR Resource Chatbot", layout="wide", page_icon="🔎")
 
 # Custom CSS for better styling
@@ -69,6 +73,108 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_http_session():
+    """Keep-alive session shared across reruns and browser sessions.
+
+    Sharing one Session is acceptable here: the backend sets no cookies and every call is
+    a stateless JSON POST with static headers, so only the connection pool is really
+    shared. Never close it — that would tear down the pool for every user.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def stream_chat(query, top_k):
+    """Yield NDJSON events from /chat/stream as the backend produces them."""
+    payload = {"query": query, "top_k": top_k}
+    with get_http_session().post(f"{API_URL}/chat/stream", json=payload, stream=True, timeout=REQUEST_TIMEOUT) as r:
+        r.raise_for_status()
+        for line in r.iter_lines():
+            if line:
+                yield json.loads(line)
+
+class CacheMiss(Exception):
+    pass
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def cached_chat_result(query, top_k, _result=None):
+    """Final assembled result per (query, top_k).
+
+    Called without _result this is a pure lookup: exceptions are never cached, so a miss
+    raises CacheMiss and leaves the entry free to be stored once the stream completes.
+    """
+    if _result is None:
+        raise CacheMiss()
+    return _result
+
+def stream_chat_result(query, top_k, answer_box, cards):
+    """Draw candidate cards as they arrive, then stream the answer; return the assembled result."""
+    start_time = time.monotonic()
+    events = stream_chat(query, top_k)
+    candidates = []
+    first_chunk = None
+    # the backend sends every candidate before the first answer chunk
+    for event in events:
+        if event["type"] == "answer":
+            first_chunk = event["content"]
+            break
+        candidate = {"employee": event["employee"], "score": event["score"]}
+        candidates.append(candidate)
+        with cards:
+            render_candidate(candidate)
+
+    def answer_chunks():
+        if first_chunk is None:
+            return
+        yield first_chunk
+        for event in events:
+            if event["type"] == "answer":
+                yield event["content"]
+
+    with answer_box:
+        answer = st.write_stream(answer_chunks())
+    return {"answer": answer, "candidates": candidates, "response_time": time.monotonic() - start_time}
+
+def render_candidate(c):
+    emp = c["employee"]
+    score = c.get("score", 0)
+    
+    # Availability styling
+    availability = emp.get("availability", "").lower()
+    if availability == "available":
+        avail_class = "availability-available"
+    elif availability == "busy":
+        avail_class = "availability-busy"
+    elif availability == "on_notice":
+        avail_class = "availability-on_notice"
+    else:
+        avail_class = ""
+    
+    with st.container():
+        st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
+        
+        col_a, col_b = st.columns([3, 1])
+        with col_a:
+            st.markdown(f"**{emp['name']}**")
+            st.write(f"*{emp.get('role', 'No role specified')}*")
+        with col_b:
+            st.markdown(f"<span class='{avail_class}'>{availability.upper()}</span>", 
+                       unsafe_allow_html=True)
+            st.write(f"Score: {score:.3f}")
+        
+        st.write(f"**Experience:** {emp.get('experience_years', 'N/A')} years")
+        
+        st.write("**Skills:** " + ", ".join(emp.get("skills", [])))
+        st.write("**Projects:** " + ", ".join(emp.get("projects", [])))
+        
+        if emp.get("notes"):
+            st.write(f"**Notes:** {emp.get('notes')}")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
 def main():
     st.markdown('<h1 class="main-header">🔎 HR Resource Query Chatbot</h1>', unsafe_allow_html=True)
     
@@ -118,72 +224,44 @@ def main():
             if not query.strip():
                 st.warning("Please enter a query first!")
             else:
-                with st.spinner("🔍 Searching for the best candidates..."):
+                # Placeholders keep the answer-first layout while candidates stream in below it
+                status = st.empty()
+                st.markdown("### 💬 Chatbot Response")
+                answer_box = st.container()
+                st.markdown("### 👥 Matching Candidates")
+                cards = st.container()
+                try:
                     try:
-                        payload = {"query": query, "top_k": top_k}
-                        start_time = time.time()
-                        
-                        r = requests.post(f"{API_URL}/chat/", json=payload, timeout=30)
-                        r.raise_for_status()
-                        data = r.json()
-                        
-                        response_time = time.time() - start_time
-                        
-                        # Display results
-                        st.success(f"Found {len(data.get('candidates', []))} candidates in {response_time:.2f}s")
-                        
-                        # Chatbot response
-                        st.markdown("### 💬 Chatbot Response")
-                        st.write(data.get("answer", "No response generated."))
-                        
-                        # Structured candidate results
-                        st.markdown("### 👥 Matching Candidates")
-                        
-                        if not data.get("candidates"):
-                            st.info("No candidates found matching your criteria.")
-                        else:
-                            for i, c in enumerate(data.get("candidates", [])):
-                                emp = c["employee"]
-                                score = c.get("score", 0)
-                                
-                                # Availability styling
-                                availability = emp.get("availability", "").lower()
-                                if availability == "available":
-                                    avail_class = "availability-available"
-                                elif availability == "busy":
-                                    avail_class = "availability-busy"
-                                elif availability == "on_notice":
-                                    avail_class = "availability-on_notice"
-                                else:
-                                    avail_class = ""
-                                
-                                with st.container():
-                                    st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
-                                    
-                                    col_a, col_b = st.columns([3, 1])
-                                    with col_a:
-                                        st.markdown(f"**{emp['name']}**")
-                                        st.write(f"*{emp.get('role', 'No role specified')}*")
-                                    with col_b:
-                                        st.markdown(f"<span class='{avail_class}'>{availability.upper()}</span>", 
-                                                   unsafe_allow_html=True)
-                                        st.write(f"Score: {score:.3f}")
-                                    
-                                    st.write(f"**Experience:** {emp.get('experience_years', 'N/A')} years")
-                                    
-                                    st.write("**Skills:** " + ", ".join(emp.get("skills", [])))
-                                    st.write("**Projects:** " + ", ".join(emp.get("projects", [])))
-                                    
-                                    if emp.get("notes"):
-                                        st.write(f"**Notes:** {emp.get('notes')}")
-                                    
-                                    st.markdown('</div>', unsafe_allow_html=True)
+                        result = cached_chat_result(query.strip(), top_k)
+                        cached = True
+                        with answer_box:
+                            st.write(result["answer"])
+                        for c in result["candidates"]:
+                            with cards:
+                                render_candidate(c)
+                    except CacheMiss:
+                        cached = False
+                        with status, st.spinner("🔍 Searching for the best candidates..."):
+                            result = stream_chat_result(query.strip(), top_k, answer_box, cards)
+                        cached_chat_result(query.strip(), top_k, _result=result)
+                    
+                    candidates = result["candidates"]
+                    if not result["answer"]:
+                        answer_box.write("No response generated.")
+                    if not candidates:
+                        cards.info("No candidates found matching your criteria.")
                     
-                    except requests.exceptions.RequestException as e:
-                        st.error(f"❌ Connection error: {e}")
-                        st.info("Make sure the backend server is running on http://127.0.0.1:8000")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
+                    # Display results
+                    if cached:
+                        status.success(f"Found {len(candidates)} candidates (cached, originally fetched in {result['response_time']:.2f}s)")
+                    else:
+                        status.success(f"Found {len(candidates)} candidates in {result['response_time']:.2f}s")
+                
+                except requests.exceptions.RequestException as e:
+                    st.error(f"❌ Connection error: {e}")
+                    st.info(f"Make sure the backend server is running on {API_URL}")
+                except Exception as e:
+                    st.error(f"❌ Error: {str(e)}")
     
     with col2:
         st.markdown("### 📊 Quick Stats")
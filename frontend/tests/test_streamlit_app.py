@@ -0,0 +1,42 @@
+# frontend/tests/test_streamlit_app.py
+# Runs the app headless via AppTest with the backend HTTP call mocked out
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parents[1] / "streamlit_app.py")
+
+EVENTS = [
+    {"type": "candidate", "score": 0.9,
+     "employee": {"id": 1, "name": "Alice", "role": "Engineer", "skills": ["Python"],
+                  "experience_years": 4, "projects": ["Portal"], "availability": "available"}},
+    {"type": "answer", "content": "Alice "},
+    {"type": "answer", "content": "fits."},
+]
+
+def _stream_response():
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.iter_lines.return_value = [json.dumps(e).encode() for e in EVENTS]
+    return resp
+
+def _search(at):
+    next(b for b in at.button if b.label == "🔍 Search").click().run()
+
+def test_identical_search_is_served_from_cache():
+    st.cache_data.clear()
+    with patch("requests.Session.post", return_value=_stream_response()) as post:
+        at = AppTest.from_file(APP_PATH).run()
+
+        _search(at)
+        assert post.call_count == 1
+        assert "cached" not in at.success[0].value
+        assert any("Alice fits." in m.value for m in at.markdown)
+
+        _search(at)
+        assert post.call_count == 1
+        assert "cached" in at.success[0].value